@@ -1,12 +1,21 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from influxdb import InfluxDBClient
+import csv
+import io
 import os
+import sys
 
 app = Flask(__name__)
 
 INFLUX_HOST = os.environ.get("INFLUX_HOST", "localhost")
 INFLUX_DB = os.environ.get("INFLUX_DB", "sensor_data")
 INFLUX_PORT = int(os.environ.get("INFLUX_PORT", 8086))
+# /api/export reuses server/export_data.py; point this at a copy of the
+# server/ directory when the backend is deployed without the full checkout
+SERVER_DIR = os.environ.get(
+    "SMARTGUARD_SERVER_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "server"),
+)
 
 try:
     influx = InfluxDBClient(host=INFLUX_HOST, port=INFLUX_PORT, database=INFLUX_DB)
@@ -80,6 +89,50 @@ def get_history():
         print(f"[DEBUG] Fetched {len(data)} points, last time: {data[-1]['time']}")
     return jsonify(data)
 
+def load_export_helpers():
+    if SERVER_DIR not in sys.path:
+        sys.path.insert(0, SERVER_DIR)
+    import export_data
+    return export_data
+
+@app.route("/api/export")
+def get_export():
+    try:
+        export_data = load_export_helpers()
+    except ImportError as e:
+        return jsonify({"error": f"export unavailable: {e}"}), 503
+
+    try:
+        rows = export_data.iter_rows(
+            influx,
+            rooms=export_data.split_list(request.args.get('rooms')),
+            metrics=export_data.split_list(request.args.get('metrics')),
+            start_ns=export_data.to_ns(request.args["start_time"]) if request.args.get("start_time") else None,
+            end_ns=export_data.to_ns(request.args["end_time"]) if request.args.get("end_time") else None,
+            window=int(request.args.get("window", 600)),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Stream the CSV one time window at a time instead of building it in memory
+    def generate():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(export_data.COLUMNS)
+        for row in rows:
+            writer.writerow(row)
+            if buf.tell() > 64 * 1024:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+        yield buf.getvalue()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/csv",
+        headers={"Content-Disposition": "attachment; filename=sensor_data.csv"},
+    )
+
 @app.route("/api/alerts")
 def get_alerts():
     page = int(request.args.get('page', 1))
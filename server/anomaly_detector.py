@@ -30,17 +30,19 @@ THRESHOLDS = {
 
 influx = InfluxDBClient(host=INFLUX_HOST, database=INFLUX_DB)
 
-def check_anomaly(metric_type, value, room, sensor_id):
+def check_anomaly(metric_type, value, room, sensor_id, store=True):
     threshold = THRESHOLDS.get(metric_type, {})
 
     if threshold.get('max') and value > threshold['max']:
         print_alert(metric_type, value, room, sensor_id, 'HIGH', '↑')
-        log_alert(f"HIGH {metric_type.upper()}: {value} in {room}", metric_type, value, room, sensor_id, 'HIGH')
+        if store:
+            log_alert(f"HIGH {metric_type.upper()}: {value} in {room}", metric_type, value, room, sensor_id, 'HIGH')
         return True
 
     if threshold.get('min') and value < threshold['min']:
         print_alert(metric_type, value, room, sensor_id, 'LOW', '↓')
-        log_alert(f"LOW {metric_type.upper()}: {value} in {room}", metric_type, value, room, sensor_id, 'LOW')
+        if store:
+            log_alert(f"LOW {metric_type.upper()}: {value} in {room}", metric_type, value, room, sensor_id, 'LOW')
         return True
 
     return False
@@ -78,9 +80,10 @@ def on_message(client, userdata, msg):
     except Exception as e:
         print(f"[ERROR] {e}")
 
-client = mqtt.Client()
-client.on_connect = on_connect
-client.on_message = on_message
-client.connect(MQTT_BROKER, 1883, 60)
-print("Anomaly Detector started...")
-client.loop_forever()
+if __name__ == "__main__":
+    client = mqtt.Client()
+    client.on_connect = on_connect
+    client.on_message = on_message
+    client.connect(MQTT_BROKER, 1883, 60)
+    print("Anomaly Detector started...")
+    client.loop_forever()
@@ -0,0 +1,124 @@
+import argparse
+import csv
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from influxdb import InfluxDBClient
+
+INFLUX_HOST = "localhost"
+INFLUX_DB = "sensor_data"
+
+COLUMNS = ["time", "room", "sensor_id", "type", "value"]
+
+TIME_RE = re.compile(r'^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.(\d+))?(Z|[+-]\d\d:\d\d)?$')
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def to_ns(value):
+    # Accepts '2025-11-10T21:56:34Z'; fractional seconds (kept to the
+    # nanosecond) and '+05:30' style offsets are allowed, no offset means UTC
+    m = TIME_RE.match(value.strip())
+    if not m:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    base, fraction, offset = m.groups()
+    if not offset or offset == 'Z':
+        offset = '+00:00'
+    dt = datetime.fromisoformat(base + offset)
+    seconds = (dt - EPOCH) // timedelta(seconds=1)
+    return seconds * 10**9 + int((fraction or '').ljust(9, '0')[:9])
+
+def quote(value):
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+def build_where(rooms, metrics):
+    clauses = []
+    if rooms:
+        clauses.append("(" + " OR ".join(f'"room" = \'{quote(r)}\'' for r in rooms) + ")")
+    if metrics:
+        clauses.append("(" + " OR ".join(f'"type" = \'{quote(m)}\'' for m in metrics) + ")")
+    return clauses
+
+def first_time(influx, clauses, lo, hi):
+    # Time of the first matching point in [lo, hi], or None if there is none
+    bounds = [f"time <= {hi}"] + ([f"time >= {lo}"] if lo is not None else [])
+    where = " AND ".join(clauses + bounds)
+    first = list(influx.query(f'SELECT FIRST("value") FROM "sensor_data" WHERE {where}', epoch='ns').get_points())
+    return first[0]['time'] if first else None
+
+def iter_rows(influx, rooms=None, metrics=None, start_ns=None, end_ns=None, window=600):
+    """Yield sensor_data points in time order, one time window per query so
+    memory stays bounded no matter how large the selection is."""
+    if int(window) <= 0:
+        raise ValueError("window must be a positive number of seconds")
+    return _iter_windows(influx, build_where(rooms, metrics), start_ns, end_ns, int(window) * 10**9)
+
+def _iter_windows(influx, clauses, start_ns, end_ns, step):
+    if end_ns is None:
+        end_ns = time.time_ns()
+    # Empty stretches are skipped by jumping to the next stored point, so the
+    # number of queries follows the data rather than the calendar
+    lo = first_time(influx, clauses, start_ns, end_ns)
+    while lo is not None and lo <= end_ns:
+        hi = min(lo + step, end_ns + 1)
+        where = " AND ".join(clauses + [f"time >= {lo}", f"time < {hi}"])
+        query = (
+            f'SELECT "value", "room", "sensor_id", "type" FROM "sensor_data" '
+            f'WHERE {where} ORDER BY time ASC'
+        )
+        found = False
+        for point in influx.query(query).get_points():
+            found = True
+            yield [point.get(col) for col in COLUMNS]
+        lo = hi if found else first_time(influx, clauses, hi, end_ns)
+
+def write_csv(rows, out):
+    writer = csv.writer(out)
+    writer.writerow(COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+def split_list(value):
+    return [v.strip() for v in value.split(',') if v.strip()] if value else None
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be a positive number of seconds")
+    return number
+
+def main():
+    parser = argparse.ArgumentParser(description="Export sensor_data from InfluxDB to CSV")
+    parser.add_argument("--host", default=INFLUX_HOST)
+    parser.add_argument("--port", type=int, default=8086)
+    parser.add_argument("--db", default=INFLUX_DB)
+    parser.add_argument("--rooms", help="comma-separated rooms, e.g. CR101,CR102 (default: all)")
+    parser.add_argument("--metrics", help="comma-separated metrics, e.g. temperature,co2 (default: all)")
+    parser.add_argument("--start", help="start time, RFC3339 (default: earliest point)")
+    parser.add_argument("--end", help="end time, RFC3339 (default: now)")
+    parser.add_argument("--window", type=positive_int, default=600, help="seconds of data fetched per query")
+    parser.add_argument("-o", "--output", default="-", help="output CSV file (default: stdout)")
+    args = parser.parse_args()
+
+    influx = InfluxDBClient(host=args.host, port=args.port, database=args.db)
+    rows = iter_rows(
+        influx,
+        rooms=split_list(args.rooms),
+        metrics=split_list(args.metrics),
+        start_ns=to_ns(args.start) if args.start else None,
+        end_ns=to_ns(args.end) if args.end else None,
+        window=args.window,
+    )
+
+    if args.output == "-":
+        count = write_csv(rows, sys.stdout)
+    else:
+        with open(args.output, "w", newline="") as f:
+            count = write_csv(rows, f)
+    print(f"[EXPORT] {count} rows written to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
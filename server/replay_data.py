@@ -0,0 +1,91 @@
+import argparse
+import csv
+import json
+import sys
+import time
+
+import paho.mqtt.client as mqtt
+
+from export_data import to_ns
+
+MQTT_BROKER = "10.0.0.254"
+
+def read_rows(path):
+    # Rows are streamed straight from the file, never loaded all at once
+    f = sys.stdin if path == "-" else open(path, newline="")
+    try:
+        for row in csv.DictReader(f):
+            yield row
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+def replay(rows, handle, speed):
+    """Call handle(row) for every exported row, spacing calls to match the
+    recorded gaps divided by speed. A speed of 0 replays as fast as possible."""
+    start_wall = time.monotonic()
+    first_ns = None
+    count = 0
+    for row in rows:
+        if speed > 0:
+            ts = to_ns(row['time'])
+            if first_ns is None:
+                first_ns = ts
+            delay = (ts - first_ns) / 1e9 / speed - (time.monotonic() - start_wall)
+            if delay > 0:
+                time.sleep(delay)
+        handle(row)
+        count += 1
+    return count
+
+def mqtt_handler(client):
+    def handle(row):
+        payload = json.dumps({
+            'sensor_id': row['sensor_id'],
+            'room': row['room'],
+            'type': row['type'],
+            'value': float(row['value']),
+            'timestamp': row['time']
+        })
+        client.publish(f"sensors/{row['type']}/{row['room']}/{row['sensor_id']}", payload)
+    return handle
+
+def detector_handler(store, counts):
+    import anomaly_detector
+
+    def handle(row):
+        if anomaly_detector.check_anomaly(row['type'], float(row['value']), row['room'], row['sensor_id'], store=store):
+            counts[row['type']] = counts.get(row['type'], 0) + 1
+    return handle
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay an exported sensor_data CSV at N x real time")
+    parser.add_argument("input", help="CSV produced by export_data.py or /api/export ('-' for stdin)")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier, 0 = no delay")
+    parser.add_argument("--target", choices=["mqtt", "detector"], default="mqtt",
+                        help="publish to the MQTT broker or feed the anomaly detector directly")
+    parser.add_argument("--broker", default=MQTT_BROKER)
+    parser.add_argument("--store-alerts", action="store_true",
+                        help="with --target detector, write alerts to InfluxDB like the live detector")
+    args = parser.parse_args()
+
+    rows = read_rows(args.input)
+    began = time.monotonic()
+
+    if args.target == "mqtt":
+        client = mqtt.Client()
+        client.connect(args.broker, 1883, 60)
+        client.loop_start()
+        count = replay(rows, mqtt_handler(client), args.speed)
+        client.disconnect()
+        client.loop_stop()
+        print(f"[REPLAY] Published {count} readings in {time.monotonic() - began:.1f}s")
+    else:
+        counts = {}
+        count = replay(rows, detector_handler(args.store_alerts, counts), args.speed)
+        print(f"[REPLAY] Checked {count} readings in {time.monotonic() - began:.1f}s")
+        for metric, n in sorted(counts.items()):
+            print(f"[REPLAY] {metric.upper():<11} | Alerts: {n}")
+
+if __name__ == "__main__":
+    main()